@@ -5,13 +5,18 @@ https://github.com/marcoboers/home-assistant-quatt
 """
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_IP_ADDRESS, CONF_SCAN_INTERVAL, Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import (
     async_create_clientsession,
     async_get_clientsession,
 )
+from homeassistant.helpers.typing import ConfigType
 
 from .api import (
     QuattApiClient,
@@ -19,32 +24,65 @@ from .api import (
     QuattApiClientCommunicationError,
     QuattApiClientError,
 )
-from .const import CONF_POWER_SENSOR, DEFAULT_SCAN_INTERVAL, DOMAIN, LOGGER
+from .const import (
+    CONF_POWER_SENSOR,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    LOGGER,
+    MIN_SCAN_INTERVAL,
+)
 from .coordinator import QuattDataUpdateCoordinator
 
-PLATFORMS: list[Platform] = [
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+PLATFORMS: tuple[Platform, ...] = (
     Platform.BINARY_SENSOR,
     Platform.SENSOR,
-]
+)
+
+
+def _get_update_interval(entry: ConfigEntry) -> timedelta:
+    """Get the update interval from the options, raised to the minimum when lower."""
+    scan_interval = int(entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL))
+    if scan_interval < MIN_SCAN_INTERVAL:
+        LOGGER.warning(
+            "Scan interval of %s seconds raised to %s seconds",
+            scan_interval,
+            MIN_SCAN_INTERVAL,
+        )
+        scan_interval = MIN_SCAN_INTERVAL
+    return timedelta(seconds=scan_interval)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Quatt integration."""
+    hass.data[DOMAIN] = {}
+    return True
 
 
 # https://developers.home-assistant.io/docs/config_entries_index/#setting-up-an-entry
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up this integration using UI."""
-    hass.data.setdefault(DOMAIN, {})
+    # A dedicated session keeps the CIC connection pool apart from other integrations,
+    # Home Assistant sets up its connector (resolver, SSL) and closes it on shutdown
+    session = async_create_clientsession(hass)
+    # Close it on unload as well, so a reload does not leave the old session open
+    entry.async_on_unload(session.close)
+    client = QuattApiClient(
+        ip_address=entry.data[CONF_IP_ADDRESS],
+        session=session,
+    )
+    update_interval = _get_update_interval(entry)
     hass.data[DOMAIN][entry.entry_id] = coordinator = QuattDataUpdateCoordinator(
         hass=hass,
-        update_interval=entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
-        client=QuattApiClient(
-            ip_address=entry.data[CONF_IP_ADDRESS],
-            session=async_get_clientsession(hass),
-        ),
+        update_interval=update_interval,
+        client=client,
     )
     # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
     await coordinator.async_config_entry_first_refresh()
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    # On update of the options reload the entry which reloads the coordinator
+    # On update of the options update the interval or reload the entry
     entry.async_on_unload(entry.add_update_listener(update_listener))
 
     return True
@@ -59,28 +97,54 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Update listener."""
-    await hass.config_entries.async_reload(entry.entry_id)
-
-
-async def _get_cic_hostname(hass: HomeAssistant, ip_address: str) -> str:
+    coordinator: QuattDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    changed_options = {
+        key
+        for key in entry.options.keys() | coordinator.options.keys()
+        if entry.options.get(key) != coordinator.options.get(key)
+    }
+
+    # Changed data (like the CIC address) or other options (like the power sensor)
+    # require a reload of the entry
+    if (entry.data != coordinator.data_snapshot) or (
+        changed_options - {CONF_SCAN_INTERVAL}
+    ):
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    if not changed_options:
+        return
+
+    # A changed scan interval only needs the coordinator to be rescheduled
+    coordinator.update_interval = _get_update_interval(entry)
+    coordinator.options = dict(entry.options)
+    # Refresh now so the pending refresh is rescheduled with the new interval
+    await coordinator.async_request_refresh()
+
+
+async def _get_cic_hostname(hass: HomeAssistant, ip_address: str) -> str | None:
     """Validate credentials."""
     client = QuattApiClient(
         ip_address=ip_address,
-        session=async_create_clientsession(hass),
+        session=async_get_clientsession(hass),
     )
     data = await client.async_get_data()
-    return data["system"]["hostName"]
-
-
-async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
-    """Migrate old entry."""
-
-    if config_entry.version == 1:
-        # Migrate CONF_POWER_SENSOR from data to options
-        # Set the unique_id of the cic
-        LOGGER.debug("Migrating config entry from version '%s'", config_entry.version)
-
-        # The old version does not have a unique_id so we get the CIC hostname and set it
+    system = data.get("system") if isinstance(data, dict) else None
+    if not isinstance(system, dict):
+        return None
+    return system.get("hostName")
+
+
+async def _migrate_v1_to_v2(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
+    """Migrate a config entry from version 1 to version 2."""
+    # Migrate CONF_POWER_SENSOR from data to options
+    # Set the unique_id of the cic
+    LOGGER.debug("Migrating config entry from version '%s'", config_entry.version)
+
+    # The old version does not have a unique_id so we get the CIC hostname and set it
+    # An existing unique_id is only reused without a request when it is a CIC hostname
+    hostname_unique_id = config_entry.unique_id
+    if (hostname_unique_id is None) or (hostname_unique_id[:3].lower() != "cic"):
         # Return that the migration failed in case the retrieval fails
         try:
             hostname_unique_id = await _get_cic_hostname(hass=hass, ip_address=config_entry.data[CONF_IP_ADDRESS])
@@ -93,29 +157,55 @@ async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
         except QuattApiClientError as exception:
             LOGGER.exception(exception)
             return False
-        else:
-            # Validate that the hostname is found
-            if (hostname_unique_id is not None) and (len(hostname_unique_id) >= 3):
-                # Uppercase the first 3 characters CIC-xxxxxxxx-xxxx-xxxx-xxxxxxxxxxxx
-                # This enables the correct match on DHCP hostname
-                hostname_unique_id = hostname_unique_id[:3].upper() + hostname_unique_id[3:]
-
-                new_data = {**config_entry.data}
-                new_options = {**config_entry.options}
-
-                if CONF_POWER_SENSOR in new_data:
-                    # Move the CONF_POWER_SENSOR to the options
-                    new_options[CONF_POWER_SENSOR] = new_data.pop(CONF_POWER_SENSOR)
-
-                # Update the config entry to version 2
-                hass.config_entries.async_update_entry(
-                    config_entry,
-                    data=new_data,
-                    options=new_options,
-                    unique_id=hostname_unique_id,
-                    version=2
-                )
-            else:
-                return False
+
+    # Validate that the hostname is found
+    if (hostname_unique_id is not None) and (len(hostname_unique_id) >= 3):
+        # Uppercase the first 3 characters CIC-xxxxxxxx-xxxx-xxxx-xxxxxxxxxxxx
+        # This enables the correct match on DHCP hostname
+        prefix = hostname_unique_id[:3]
+        if not prefix.isupper():
+            hostname_unique_id = prefix.upper() + hostname_unique_id[3:]
+
+        new_data = config_entry.data
+        new_options = config_entry.options
+
+        if CONF_POWER_SENSOR in config_entry.data:
+            # Move the CONF_POWER_SENSOR to the options
+            new_data = {
+                key: value
+                for key, value in config_entry.data.items()
+                if key != CONF_POWER_SENSOR
+            }
+            new_options = {
+                **config_entry.options,
+                CONF_POWER_SENSOR: config_entry.data[CONF_POWER_SENSOR],
+            }
+
+        # Update the config entry to version 2
+        hass.config_entries.async_update_entry(
+            config_entry,
+            data=new_data,
+            options=new_options,
+            unique_id=hostname_unique_id,
+            version=2
+        )
+    else:
+        return False
+
+    return True
+
+
+# Migration steps keyed by the version they migrate from
+_MIGRATIONS: dict[int, Callable[[HomeAssistant, ConfigEntry], Awaitable[bool]]] = {
+    1: _migrate_v1_to_v2,
+}
+
+
+async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
+    """Migrate old entry."""
+    # Each step bumps the version, so every migration runs exactly once
+    while config_entry.version in _MIGRATIONS:
+        if not await _MIGRATIONS[config_entry.version](hass, config_entry):
+            return False
 
     return True
@@ -3,16 +3,63 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import random
 import socket
+import time
 
 import aiohttp
+import orjson
+from yarl import URL
 
-# Number of retries on ServerDisconnectedError
+# Number of attempts for requests that fail with a retryable error
 RETRY_ATTEMPTS = 3
 
+# Exponential backoff between retries: delay = min(MAX_DELAY, BASE_DELAY * 2^attempt) +/- JITTER (fraction)
+BASE_DELAY = 0.5
+MAX_DELAY = 30.0
+JITTER = 0.5
+
+# Consecutive failed requests after which requests are skipped for a cooldown period
+CIRCUIT_BREAKER_THRESHOLD = 5
+# Upper bound in seconds for the cooldown period, which doubles with every failure
+CIRCUIT_BREAKER_MAX_COOLDOWN = 60
+
+# Overall time budget in seconds for a request including all retries
+REQUEST_BUDGET = 30
+
+# Timeout applied by aiohttp to every request
+_DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=20, connect=5, sock_read=15)
+
+# Response statuses that indicate invalid credentials
+_AUTH_ERROR_STATUSES = frozenset({401, 403})
+
+# Response statuses that indicate a transient problem worth retrying, other statuses are permanent
+_RETRY_STATUSES = frozenset({408, 429, *range(500, 600)})
+
+# Errors that are reported as a communication error with the CIC
+_COMMUNICATION_ERRORS = (TimeoutError, aiohttp.ClientError, socket.gaierror)
+
+# Errors that indicate the CIC cannot be reached, only these count towards the circuit breaker
+_CONNECTION_ERRORS = (TimeoutError, aiohttp.ClientConnectionError, socket.gaierror)
+
 _LOGGER = logging.getLogger(__name__)
 
 
+def _retryable(exception: BaseException) -> bool:
+    """Check if a request that raised the exception can be retried."""
+    if isinstance(exception, aiohttp.ClientResponseError):
+        return exception.status in _RETRY_STATUSES
+    # Connection problems are transient, for instance while the CIC is rebooting
+    return isinstance(
+        exception,
+        (
+            aiohttp.ServerDisconnectedError,
+            aiohttp.ServerTimeoutError,
+            aiohttp.ClientConnectorError,
+        ),
+    )
+
+
 class QuattApiClientError(Exception):
     """Exception to indicate a general API error."""
 
@@ -27,6 +74,15 @@ class QuattApiClientAuthenticationError(QuattApiClientError):
 class QuattApiClient:
     """Quatt API Client."""
 
+    __slots__ = (
+        "_ip_address",
+        "_session",
+        "_data_url",
+        "_consecutive_failures",
+        "_circuit_open_until",
+        "_random",
+    )
+
     def __init__(
         self,
         ip_address: str,
@@ -35,73 +91,161 @@ class QuattApiClient:
         """Quatt API Client."""
         self._ip_address = ip_address
         self._session = session
+        self._data_url = URL(
+            f"http://{ip_address}:8080/beta/feed/data.json", encoded=True
+        )
+        self._consecutive_failures = 0
+        self._circuit_open_until = 0.0
+        # Separately seeded per client so multiple CICs do not retry in lockstep
+        self._random = random.Random()
 
     async def async_get_data(self) -> any:
         """Get data from the API."""
-        return await self._api_wrapper(method="get", path="/beta/feed/data.json")
+        return await self._api_wrapper(method="get", url=self._data_url)
 
     @staticmethod
     def check_response_status(response):
         """Check the response status of the api response."""
-        if response.status in (401, 403):
+        if response.status in _AUTH_ERROR_STATUSES:
             raise QuattApiClientAuthenticationError("Invalid credentials")
 
     async def _api_wrapper(
         self,
         method: str,
-        path: str,
+        url: URL,
         data: dict | None = None,
         headers: dict | None = None,
     ) -> any:
         """Get information from the API."""
-        url = "http://" + self._ip_address + ":8080" + path
-
+        # Fail fast while the CIC is known to be unreachable
+        if time.monotonic() < self._circuit_open_until:
+            raise QuattApiClientCommunicationError(
+                "Skipping request, the CIC was unreachable for the last "
+                f"{self._consecutive_failures} attempts"
+            )
+
+        try:
+            # A single budget for all attempts bounds the total time of one data fetch
+            async with asyncio.timeout(REQUEST_BUDGET):
+                result = await self._request_with_retry(method, url, data, headers)
+        except TimeoutError as exception:
+            self._record_failure()
+            _LOGGER.error("Timeout fetching information from %s after retries", url)
+            raise QuattApiClientCommunicationError(
+                "Timeout error fetching information",
+            ) from exception
+        except QuattApiClientCommunicationError as exception:
+            # A response with an unexpected status means the CIC is reachable
+            if isinstance(exception.__cause__, _CONNECTION_ERRORS):
+                self._record_failure()
+            raise
+
+        self._consecutive_failures = 0
+        return result
+
+    def _record_failure(self) -> None:
+        """Register a failed request and open the circuit when the threshold is reached."""
+        self._consecutive_failures += 1
+        if self._consecutive_failures >= CIRCUIT_BREAKER_THRESHOLD:
+            cooldown = min(CIRCUIT_BREAKER_MAX_COOLDOWN, 2**self._consecutive_failures)
+            self._circuit_open_until = time.monotonic() + cooldown
+            _LOGGER.warning(
+                "CIC unreachable for %d attempts, pausing requests for %d seconds",
+                self._consecutive_failures,
+                cooldown,
+            )
+
+    async def _request_with_retry(
+        self,
+        method: str,
+        url: URL,
+        data: dict | None,
+        headers: dict | None,
+    ) -> any:
+        """Perform a request, retrying on retryable errors."""
         for attempt in range(RETRY_ATTEMPTS):
-            try:
+            if _LOGGER.isEnabledFor(logging.DEBUG):
                 _LOGGER.debug("Fetching data from url: %s (Attempt %d)", url, attempt + 1)
-                async with asyncio.timeout(20):
-                    response = await self._session.request(
-                        method=method,
-                        url=url,
-                        headers=headers,
-                        json=data,
-                    )
-                    self.check_response_status(response)
-                    response.raise_for_status()
-
-                    return await response.json()
+            try:
+                return await self._do_request(method, url, data, headers)
 
-            except aiohttp.ServerDisconnectedError as exception:
-                # Sometimes the ServerDisconnectedError is raised so retry to get the information
-                _LOGGER.debug("Server disconnected error. Retrying... Attempt %d", attempt + 1)
-                if attempt == RETRY_ATTEMPTS - 1:
+            except aiohttp.ClientError as exception:
+                # Only retryable errors (like a ServerDisconnectedError) are passed on by _do_request
+                retry_error = exception
+                if attempt < RETRY_ATTEMPTS - 1:
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        _LOGGER.debug(
+                            "%s, retrying... Attempt %d", type(exception).__name__, attempt + 1
+                        )
+                    await self._backoff(attempt)
+
+        _LOGGER.error(
+            "%s fetching information from %s after %d attempts: %s",
+            type(retry_error).__name__,
+            url,
+            RETRY_ATTEMPTS,
+            retry_error,
+        )
+        raise QuattApiClientCommunicationError(
+            "Request failed after multiple attempts"
+        ) from retry_error
+
+    async def _backoff(self, attempt: int) -> None:
+        """Sleep an exponentially growing, jittered delay before the next attempt."""
+        delay = min(MAX_DELAY, BASE_DELAY * 2**attempt) * (
+            1 + self._random.uniform(-JITTER, JITTER)
+        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Retrying in %.3f seconds", delay)
+        await asyncio.sleep(delay)
+
+    async def _do_request(
+        self,
+        method: str,
+        url: URL,
+        data: dict | None,
+        headers: dict | None,
+    ) -> any:
+        """Perform a single request, retryable errors are left to the caller."""
+        # Only pass headers and a body when given, a body is serialized with orjson
+        kwargs: dict = {"timeout": _DEFAULT_TIMEOUT}
+        if data is not None:
+            kwargs["data"] = orjson.dumps(data)
+            headers = {**(headers or {}), "Content-Type": "application/json"}
+        if headers:
+            kwargs["headers"] = headers
+
+        try:
+            async with self._session.request(method, url, **kwargs) as response:
+                self.check_response_status(response)
+                if response.status in _RETRY_STATUSES:
+                    response.raise_for_status()
+                if response.status != 200:
                     raise QuattApiClientCommunicationError(
-                        "Server disconnected after multiple attempts"
-                    ) from exception
-                await asyncio.sleep(0.1)
-
-            except TimeoutError as exception:
-                _LOGGER.error("Timeout error fetching information from %s: %s", url, exception)
-                raise QuattApiClientCommunicationError(
-                    "Timeout error fetching information",
-                ) from exception
+                        f"Unexpected status {response.status}"
+                    )
 
-            except aiohttp.ClientError as exception:
-                _LOGGER.error("Client error fetching information from %s: %s", url, exception)
-                raise QuattApiClientCommunicationError(
-                    "Client error fetching information",
-                ) from exception
-
-            except socket.gaierror as exception:
-                _LOGGER.error("Socket error fetching information from %s: %s", url, exception)
-                raise QuattApiClientCommunicationError(
-                    "Socket error fetching information",
-                ) from exception
-
-            except Exception as exception:  # pylint: disable=broad-except
-                _LOGGER.error("Unexpected error in _api_wrapper. URL: %s, Exception: %s", url, exception)
-                raise QuattApiClientError(
-                    "Unexpected error in _api_wrapper",
-                ) from exception
-
-        return None
+                return orjson.loads(await response.read())
+
+        except QuattApiClientError:
+            # Includes authentication errors, which are never retried
+            raise
+
+        except _COMMUNICATION_ERRORS as exception:
+            if _retryable(exception):
+                raise
+            _LOGGER.error(
+                "%s fetching information from %s: %s",
+                type(exception).__name__,
+                url,
+                exception,
+            )
+            raise QuattApiClientCommunicationError(
+                "Communication error fetching information",
+            ) from exception
+
+        except Exception as exception:  # pylint: disable=broad-except
+            _LOGGER.error("Unexpected error in _api_wrapper. URL: %s, Exception: %s", url, exception)
+            raise QuattApiClientError(
+                "Unexpected error in _api_wrapper",
+            ) from exception
@@ -12,7 +12,7 @@ from .const import DOMAIN
 from .coordinator import QuattDataUpdateCoordinator
 from .entity import QuattEntity, QuattSensorEntityDescription
 
-BINARY_SENSORS = [
+BINARY_SENSORS: tuple[QuattSensorEntityDescription, ...] = (
     # Heatpump 1
     QuattSensorEntityDescription(
         name="HP1 silentmode",
@@ -104,7 +104,7 @@ BINARY_SENSORS = [
         key="qc.stickyPumpProtectionEnabled",
         icon="mdi:shield-refresh-outline",
     ),
-]
+)
 
 _LOGGER = logging.getLogger(__name__)
 
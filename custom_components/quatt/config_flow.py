@@ -18,7 +18,7 @@ from homeassistant.config_entries import (
 from homeassistant.const import CONF_IP_ADDRESS, CONF_SCAN_INTERVAL
 from homeassistant.core import callback
 from homeassistant.helpers import selector
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import (
     QuattApiClient,
@@ -47,14 +47,17 @@ class QuattFlowHandler(ConfigFlow, domain=DOMAIN):
         self.hostname: str | None = None
 
 
-    async def _test_credentials(self, ip_address: str) -> str:
+    async def _test_credentials(self, ip_address: str) -> str | None:
         """Validate credentials."""
         client = QuattApiClient(
             ip_address=ip_address,
-            session=async_create_clientsession(self.hass),
+            session=async_get_clientsession(self.hass),
         )
         data = await client.async_get_data()
-        return data["system"]["hostName"]
+        system = data.get("system") if isinstance(data, dict) else None
+        if not isinstance(system, dict):
+            return None
+        return system.get("hostName")
 
 
     def is_valid_ip(self, ip_str) -> bool:
@@ -99,6 +102,10 @@ class QuattFlowHandler(ConfigFlow, domain=DOMAIN):
                         data=user_input,
                     )
 
+                # The feed does not contain a CIC hostname
+                LOGGER.error("No CIC hostname found at %s", user_input[CONF_IP_ADDRESS])
+                _errors["base"] = "connection"
+
 
         return self.async_show_form(
             step_id="user",
@@ -128,7 +135,7 @@ class QuattFlowHandler(ConfigFlow, domain=DOMAIN):
 
          # Get the status page to validate that we are dealing with a Quatt because the DHCP match is only on "cic-*"
         try:
-            await self._test_credentials(ip_address=discovery_info.ip)
+            cic_hostname = await self._test_credentials(ip_address=discovery_info.ip)
         except (
             QuattApiClientAuthenticationError,
             QuattApiClientCommunicationError,
@@ -142,6 +149,15 @@ class QuattFlowHandler(ConfigFlow, domain=DOMAIN):
             )
             return self.async_abort(reason="no_match")
         else:
+            if cic_hostname is None:
+                # A feed without a CIC hostname is not a Quatt
+                LOGGER.debug(
+                    "DHCP discovery no hostname in feed: %s with ip-address: %s",
+                    discovery_info.hostname,
+                    discovery_info.ip
+                )
+                return self.async_abort(reason="no_match")
+
             LOGGER.debug(
                 "DHCP discovery validated detected Quatt CIC: %s with ip-address: %s",
                 discovery_info.hostname,
@@ -152,7 +168,9 @@ class QuattFlowHandler(ConfigFlow, domain=DOMAIN):
             # This enables the correct match on DHCP hostname
             hostname_unique_id = discovery_info.hostname
             if len(hostname_unique_id) >= 3:
-                hostname_unique_id = hostname_unique_id[:3].upper() + hostname_unique_id[3:]
+                prefix = hostname_unique_id[:3]
+                if not prefix.isupper():
+                    hostname_unique_id = prefix.upper() + hostname_unique_id[3:]
 
             # Loop through existing config entries to check for a match with prefix
             for entry in self.hass.config_entries.async_entries(self.handler):
@@ -24,7 +24,7 @@ class QuattDataUpdateCoordinator(DataUpdateCoordinator):
     def __init__(
         self,
         hass: HomeAssistant,
-        update_interval: int,
+        update_interval: timedelta,
         client: QuattApiClient,
     ) -> None:
         """Initialize."""
@@ -33,7 +33,15 @@ class QuattDataUpdateCoordinator(DataUpdateCoordinator):
             hass=hass,
             logger=LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=update_interval),
+            update_interval=update_interval,
+        )
+
+        # Snapshot of the data and options this coordinator was set up with
+        self.data_snapshot: dict = (
+            dict(self.config_entry.data) if self.config_entry is not None else {}
+        )
+        self.options: dict = (
+            dict(self.config_entry.options) if self.config_entry is not None else {}
         )
 
         self._power_sensor_id: str = (
@@ -54,18 +62,21 @@ class QuattDataUpdateCoordinator(DataUpdateCoordinator):
 
     def heatpump1Active(self):
         """Check if heatpump 1 is active."""
-        LOGGER.debug(self.getValue("hp1"))
-        return self.getValue("hp1") is not None
+        value = self.getValue("hp1")
+        LOGGER.debug("heatpump1Active.hp1 %s", value)
+        return value is not None
 
     def heatpump2Active(self):
         """Check if heatpump 2 is active."""
-        LOGGER.debug(self.getValue("hp2"))
-        return self.getValue("hp2") is not None
+        value = self.getValue("hp2")
+        LOGGER.debug("heatpump2Active.hp2 %s", value)
+        return value is not None
 
     def boilerOpenTherm(self):
         """Check if boiler is connected to CIC ofer OpenTherm."""
-        LOGGER.debug(self.getValue("boiler.otFbChModeActive"))
-        return self.getValue("boiler.otFbChModeActive") is not None
+        value = self.getValue("boiler.otFbChModeActive")
+        LOGGER.debug("boilerOpenTherm.otFbChModeActive %s", value)
+        return value is not None
 
     def getConversionFactor(self, temperature: float):
         """Get the conversion factor for the nearest temperature."""
@@ -78,14 +89,15 @@ class QuattDataUpdateCoordinator(DataUpdateCoordinator):
         """Get heatpump power from sensor."""
         if self._power_sensor_id is None:
             return None
-        LOGGER.debug("electricalPower %s", self.hass.states.get(self._power_sensor_id))
-        if self.hass.states.get(self._power_sensor_id) is None:
+        power_state = self.hass.states.get(self._power_sensor_id)
+        LOGGER.debug("electricalPower %s", power_state)
+        if power_state is None:
             return None
-        if self.hass.states.get(self._power_sensor_id).state not in [
+        if power_state.state not in [
             STATE_UNAVAILABLE,
             STATE_UNKNOWN,
         ]:
-            return self.hass.states.get(self._power_sensor_id).state
+            return power_state.state
         return None
 
     def computedWaterDelta(self, parent_key: str | None = None):